@@ -2,8 +2,11 @@
 🎌 AI Anime Recommender - Streamlit Frontend
 """
 
+import os
+
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
 
 # =============================================================================
 # PAGE CONFIG
@@ -18,17 +21,30 @@ st.set_page_config(
 # CONFIG
 # =============================================================================
 
-# Define the FastAPI endpoint
-# API_BASE_URL = "http://localhost:8000" # Use this for local testing
-API_BASE_URL = "http://136.111.237.172:8000/"  # Use this for deployed API
+# FastAPI endpoint, e.g. API_BASE_URL=http://<external-ip>:8000 for the deployed API
+API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000").rstrip("/")
+
+HEALTH_CACHE_TTL = int(os.getenv("HEALTH_CACHE_TTL", "30"))              # seconds
+RECOMMENDATION_CACHE_TTL = int(os.getenv("RECOMMENDATION_CACHE_TTL", "3600"))  # seconds
 
 # =============================================================================
 # API FUNCTIONS
 # =============================================================================
+@st.cache_resource
+def get_session() -> requests.Session:
+    """Pooled keep-alive HTTP session shared across reruns and user sessions."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=10)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@st.cache_data(ttl=HEALTH_CACHE_TTL, show_spinner=False)
 def check_api_health() -> bool:
-    """Check if the FastAPI backend is healthy."""
+    """Check if the FastAPI backend is healthy (cached for a short TTL)."""
     try:
-        response = requests.get(f"{API_BASE_URL}/health", timeout=5)
+        response = get_session().get(f"{API_BASE_URL}/health", timeout=5)
         # Just check if API responds with 200
         return response.status_code == 200
     except Exception as e:
@@ -36,20 +52,29 @@ def check_api_health() -> bool:
         return False
 
 
+@st.cache_data(ttl=RECOMMENDATION_CACHE_TTL, max_entries=256, show_spinner=False)
+def _fetch_recommendation(query: str) -> dict:
+    """Cached API call. Raises on failure so errors are never cached."""
+    response = get_session().post(
+        f"{API_BASE_URL}/recommend",
+        json={"query": query},
+        timeout=60,
+    )
+    response.raise_for_status()
+    return response.json()
+
+
 def get_recommendation(query: str) -> dict:
     """Get anime recommendation from the API."""
     try:
-        response = requests.post(
-            f"{API_BASE_URL}/recommend",  # Changed from /api/v1/recommend
-            json={"query": query},
-            timeout=60,
-        )
-        if response.status_code == 200:
-            return {"success": True, "data": response.json()}
-        elif response.status_code == 429:
+        return {"success": True, "data": _fetch_recommendation(query)}
+    except requests.exceptions.HTTPError as e:
+        if e.response.status_code == 429:
             return {"success": False, "error": "Rate limit exceeded. Wait a moment."}
-        else:
-            return {"success": False, "error": response.json().get("detail", "Error")}
+        try:
+            return {"success": False, "error": e.response.json().get("detail", "Error")}
+        except ValueError:
+            return {"success": False, "error": "Error"}
     except requests.exceptions.Timeout:
         return {"success": False, "error": "Request timed out."}
     except Exception as e:
@@ -87,11 +112,14 @@ if st.button("🔮 Get Recommendations", type="primary", use_container_width=Tru
         st.warning("Please enter at least 3 characters.")
     else:
         with st.spinner("Finding recommendations..."):
-            result = get_recommendation(query.strip())
-        
-        if result["success"]:
-            st.divider()
-            st.subheader("✨ Recommendations")
-            st.markdown(result["data"]["answer"])
-        else:
-            st.error(result["error"])
+            # Keep the last result so reruns re-render it without calling the API
+            st.session_state["last_result"] = get_recommendation(query.strip())
+
+result = st.session_state.get("last_result")
+if result:
+    if result["success"]:
+        st.divider()
+        st.subheader("✨ Recommendations")
+        st.markdown(result["data"]["answer"])
+    else:
+        st.error(result["error"])
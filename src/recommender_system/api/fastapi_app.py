@@ -1,6 +1,9 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query
 from recommender_system.pipeline.recommend_pipeline import AnimeRecommendationPipeline
-from recommender_system.api.models import RecommendationRequest, RecommendationResponse
+from recommender_system.title_index import AnimeTitleIndex
+from recommender_system.api.models import (
+    RecommendationRequest, RecommendationResponse, AutocompleteResponse
+)
 from recommender_system.utils.custom_exception import CustomException
 
 app = FastAPI(
@@ -9,8 +12,11 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# In-memory title index for autocomplete (no LLM / vector store round trip)
+title_index = AnimeTitleIndex()
+
 # Initialize pipeline once (FAST!!)
-pipeline = AnimeRecommendationPipeline()
+pipeline = AnimeRecommendationPipeline(title_index=title_index)
 
 # human readable  
 @app.get("/")
@@ -22,12 +28,25 @@ def home():
 def health_check():
     return {
         'status': 'OK',
-        'pipeline_loaded': pipeline is not None
+        'pipeline_loaded': pipeline is not None,
+        'title_index_loaded': title_index is not None
     }
 
+@app.get("/autocomplete", response_model=AutocompleteResponse)
+def autocomplete(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(5, ge=1, le=20)
+):
+    matches = title_index.search(q, limit=limit)
+    return AutocompleteResponse(query=q, matches=matches)
+
 @app.post("/recommend", response_model=RecommendationResponse)
 def recommend(request: RecommendationRequest):
     try:
+        if request.structured:
+            result = pipeline.recommend(request.query, structured=True)
+            return RecommendationResponse(recommendations=result)
+
         result = pipeline.recommend(request.query)
         return RecommendationResponse(answer=result)
 
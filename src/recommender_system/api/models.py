@@ -1,7 +1,25 @@
+from typing import List, Optional
 from pydantic import BaseModel
 
 class RecommendationRequest(BaseModel):
     query: str
+    structured: bool = False
+
+class AnimeRecommendation(BaseModel):
+    mal_id: Optional[int] = None
+    title: str
+    summary: str
+    reason: str
 
 class RecommendationResponse(BaseModel):
-    answer: str
+    answer: Optional[str] = None
+    recommendations: Optional[List[AnimeRecommendation]] = None
+
+class TitleMatch(BaseModel):
+    mal_id: int
+    title: str
+    score: float
+
+class AutocompleteResponse(BaseModel):
+    query: str
+    matches: List[TitleMatch]
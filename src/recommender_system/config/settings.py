@@ -10,6 +10,9 @@ HF_TOKEN = os.getenv("HUGGINGFACEHUB_API_TOKEN")
 MODEL_NAME = "llama-3.1-8b-instant"
 EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
 
+# Output cap for the structured mode (LLM only writes the short "reason" fields)
+STRUCTURED_MAX_TOKENS = int(os.getenv("STRUCTURED_MAX_TOKENS", "256"))
+
 # Validate
 if GROQ_API_KEY is None:
     raise ValueError("❌ Missing GROQ_API_KEY in .env")
@@ -14,7 +14,7 @@ class AnimeRecommendationPipeline:
     for generating anime recommendations using the RAG-based recommender.
     """
 
-    def __init__(self, persist_dir: str = "chroma_db"):
+    def __init__(self, persist_dir: str = "chroma_db", title_index=None):
         try:
             logger.info("Initializing Recommendation Pipeline...")
 
@@ -32,8 +32,8 @@ class AnimeRecommendationPipeline:
             )
             vectorstore = vector_builder.load_vector_store()
 
-            # 2. Pass vectorstore to AnimeRecommender
-            self.recommender = AnimeRecommender(vectorstore)
+            # 2. Pass vectorstore (and optional title index for MAL_IDs) to AnimeRecommender
+            self.recommender = AnimeRecommender(vectorstore, title_index=title_index)
 
             logger.info("Recommendation Pipeline initialized successfully.")
 
@@ -41,9 +41,10 @@ class AnimeRecommendationPipeline:
             logger.error(f"Pipeline initialization failed: {str(e)}")
             raise CustomException("Error during pipeline initialization", e)
 
-    def recommend(self, query: str, return_sources: bool = False):
+    def recommend(self, query: str, return_sources: bool = False, structured: bool = False):
         """
         Takes a user query and returns recommendations.
+        With structured=True returns a list of {mal_id, title, summary, reason}.
         Optionally returns source documents for debugging.
         """
         try:
@@ -52,7 +53,10 @@ class AnimeRecommendationPipeline:
             if not query or not isinstance(query, str):
                 raise CustomException("Query must be a non-empty string.")
 
-            response = self.recommender.get_recommendation(query)
+            if structured:
+                response = self.recommender.get_structured_recommendation(query)
+            else:
+                response = self.recommender.get_recommendation(query)
             logger.info("Recommendation generated successfully.")
 
             # Note: get_recommendation returns just the answer string
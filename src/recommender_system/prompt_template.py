@@ -44,3 +44,35 @@ Your final structured answer:
         template=template,
         input_variables=["context", "question"]
     )
+
+
+def get_reason_prompt(format_instructions: str) -> PromptTemplate:
+    """
+    Creates the prompt for the structured recommendation mode.
+    Titles and summaries come from retrieved metadata, so the LLM only
+    writes one short reason per numbered candidate, as schema-valid JSON.
+    """
+
+    template = """
+You are an expert anime recommendation engine.
+
+Your task:
+- For EACH numbered candidate below, write ONE short sentence (max 25 words)
+  explaining why it matches the user's query.
+- Return exactly one reason per candidate, in the same order.
+- Use ONLY the information in the candidates. DO NOT use outside knowledge.
+
+Candidates:
+{candidates}
+
+User Query:
+{question}
+
+{format_instructions}
+"""
+
+    return PromptTemplate(
+        template=template,
+        input_variables=["candidates", "question"],
+        partial_variables={"format_instructions": format_instructions}
+    )
@@ -1,22 +1,53 @@
+import re
+from typing import List
+
+from pydantic import BaseModel, Field
 from langchain_core.runnables import RunnablePassthrough
 from langchain_core.prompts import PromptTemplate
+from langchain_core.output_parsers import PydanticOutputParser
 from langchain_groq import ChatGroq
 
-from recommender_system.prompt_template import get_anime_prompt
-from recommender_system.config.settings import GROQ_API_KEY, MODEL_NAME
+from recommender_system.prompt_template import get_anime_prompt, get_reason_prompt
+from recommender_system.config.settings import GROQ_API_KEY, MODEL_NAME, STRUCTURED_MAX_TOKENS
 
 from recommender_system.utils.logger import get_logger
 from recommender_system.utils.custom_exception import CustomException
 
 logger = get_logger(__name__)
 
+
+class RecommendationReasons(BaseModel):
+    """Schema the LLM must follow in structured mode: one reason per candidate."""
+    reasons: List[str] = Field(description="One short reason per candidate, in candidate order")
+
+
+def _parse_document(text: str) -> dict:
+    """Extracts title and a 2-sentence summary from a combined_info chunk."""
+    title = re.search(r"Title:\s*(.+)", text)
+    overview = re.search(r"Overview:\s*(.+)", text, re.DOTALL)
+    summary = ""
+    if overview:
+        sentences = re.split(r"(?<=[.!?])\s+", overview.group(1).strip())
+        summary = " ".join(sentences[:2])
+    return {
+        "title": title.group(1).strip() if title else "",
+        "summary": summary
+    }
+
+
 class AnimeRecommender:
-    def __init__(self, vectorstore):
+    def __init__(self, vectorstore, title_index=None, max_tokens: int = STRUCTURED_MAX_TOKENS):
         try:
             logger.info("Initializing Anime Recommender (docs-aligned)...")
 
             self.llm = ChatGroq(api_key=GROQ_API_KEY, model=MODEL_NAME, temperature=0)
 
+            # structured mode: LLM only writes short reasons, so cap its output
+            self.reason_llm = ChatGroq(
+                api_key=GROQ_API_KEY, model=MODEL_NAME, temperature=0, max_tokens=max_tokens
+            )
+            self.title_index = title_index
+
             # official: convert vector store -> retriever (Runnable)
             self.retriever = vectorstore.as_retriever(search_type="similarity", search_kwargs={"k": 3})
 
@@ -30,6 +61,14 @@ class AnimeRecommender:
                 | self.llm
             )
 
+            # structured mode: retrieved metadata + schema-validated LLM reasons
+            self.reason_parser = PydanticOutputParser(pydantic_object=RecommendationReasons)
+            self.reason_pipeline = (
+                get_reason_prompt(self.reason_parser.get_format_instructions())
+                | self.reason_llm
+                | self.reason_parser
+            )
+
         except Exception as e:
             raise CustomException("Failed to initialize AnimeRecommender", e)
 
@@ -47,3 +86,45 @@ class AnimeRecommender:
             logger.error(f"Exception message: {str(e)}")
             logger.error(f"Full traceback:\n{traceback.format_exc()}")
             raise CustomException("Failed to generate recommendation", e)
+
+    def get_structured_recommendation(self, query: str) -> list:
+        """
+        Returns a list of {mal_id, title, summary, reason} dicts.
+        Title and summary are taken from the retrieved documents; the LLM
+        only generates the reason field (bounded by max_tokens).
+        """
+        try:
+            docs = self.retriever.invoke(query)
+
+            candidates, seen = [], set()
+            for doc in docs:
+                item = _parse_document(doc.page_content)
+                if item["title"] and item["title"] not in seen:
+                    seen.add(item["title"])
+                    candidates.append(item)
+
+            if not candidates:
+                return []
+
+            numbered = "\n".join(
+                f"{i}. {c['title']}: {c['summary']}" for i, c in enumerate(candidates, start=1)
+            )
+            parsed = self.reason_pipeline.invoke({"candidates": numbered, "question": query})
+
+            if len(parsed.reasons) != len(candidates):
+                raise CustomException(
+                    f"Expected {len(candidates)} reasons, got {len(parsed.reasons)}"
+                )
+
+            return [
+                {
+                    "mal_id": self.title_index.lookup(c["title"]) if self.title_index else None,
+                    "title": c["title"],
+                    "summary": c["summary"],
+                    "reason": reason.strip()
+                }
+                for c, reason in zip(candidates, parsed.reasons)
+            ]
+        except Exception as e:
+            logger.error(f"Structured recommendation failed: {str(e)}")
+            raise CustomException("Failed to generate structured recommendation", e)
@@ -0,0 +1,134 @@
+import os
+import re
+from bisect import bisect_left
+from collections import defaultdict
+from itertools import islice
+
+import pandas as pd
+from recommender_system.utils.logger import get_logger
+from recommender_system.utils.custom_exception import CustomException
+
+logger = get_logger(__name__)
+
+
+def _normalize(text: str) -> str:
+    """Lowercase and collapse punctuation/whitespace so 'Re:Zero' == 're zero'."""
+    return " ".join(re.sub(r"[^0-9a-z]+", " ", text.lower()).split())
+
+
+def _trigrams(text: str) -> set:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class AnimeTitleIndex:
+    """
+    In-memory title lookup for autocomplete, built once at startup:
+    - Prefix index: sorted (key, id) pairs searched with bisect,
+      keyed on the full title and on every word boundary inside it
+    - Fuzzy index: character trigram -> titles, ranked by Dice similarity
+      so misspelled queries still resolve to the right title
+    """
+
+    def __init__(self, csv_path: str = "data/anime_with_synopsis.csv"):
+        try:
+            logger.info(f"Building title index from: {csv_path}")
+
+            if not os.path.exists(csv_path):
+                raise CustomException(f"CSV file not found: {csv_path}")
+
+            df = pd.read_csv(
+                csv_path,
+                encoding="utf-8",
+                usecols=["MAL_ID", "Name"],
+                on_bad_lines="skip"
+            ).dropna().drop_duplicates(subset="MAL_ID")
+
+            self.titles = []        # position -> (mal_id, title)
+            self.norm_titles = []   # position -> normalized title
+            self.trigrams = []      # position -> trigram set of normalized title
+            self.prefix_keys = []   # sorted (key, position)
+            self.gram_index = defaultdict(set)
+            self.exact = {}         # normalized title -> position
+
+            for mal_id, name in zip(df["MAL_ID"], df["Name"]):
+                norm = _normalize(str(name))
+                if not norm:
+                    continue
+
+                pos = len(self.titles)
+                self.titles.append((int(mal_id), str(name)))
+                self.norm_titles.append(norm)
+                self.exact.setdefault(norm, pos)
+
+                words = norm.split(" ")
+                for i in range(len(words)):
+                    self.prefix_keys.append((" ".join(words[i:]), pos))
+
+                grams = _trigrams(norm)
+                self.trigrams.append(grams)
+                for gram in grams:
+                    self.gram_index[gram].add(pos)
+
+            self.prefix_keys.sort()
+            logger.info(f"Title index built with {len(self.titles)} titles.")
+
+        except Exception as e:
+            raise CustomException("Failed to build title index", e)
+
+    def _prefix_matches(self, query: str, limit: int) -> list:
+        start = bisect_left(self.prefix_keys, (query, -1))
+        matches = set()
+        for key, pos in islice(self.prefix_keys, start, None):
+            if not key.startswith(query):
+                break
+            matches.add(pos)
+        # Whole-title prefixes first, then shorter titles (closer matches)
+        ranked = sorted(matches, key=lambda p: (not self.norm_titles[p].startswith(query),
+                                                len(self.norm_titles[p])))
+        return ranked[:limit]
+
+    def _fuzzy_matches(self, query: str, limit: int, min_score: float) -> list:
+        query_grams = _trigrams(query)
+        overlap = defaultdict(int)
+        for gram in query_grams:
+            for pos in self.gram_index.get(gram, ()):
+                overlap[pos] += 1
+
+        scored = []
+        for pos, shared in overlap.items():
+            score = 2 * shared / (len(query_grams) + len(self.trigrams[pos]))
+            if score >= min_score:
+                scored.append((score, pos))
+
+        scored.sort(key=lambda item: (-item[0], len(self.titles[item[1]][1])))
+        return scored[:limit]
+
+    def lookup(self, title: str):
+        """Returns the MAL_ID for an exact (normalized) title, else None."""
+        pos = self.exact.get(_normalize(title or ""))
+        return self.titles[pos][0] if pos is not None else None
+
+    def search(self, query: str, limit: int = 5, min_score: float = 0.3) -> list:
+        """
+        Returns up to `limit` ranked {"mal_id", "title", "score"} matches.
+        Exact prefix matches score 1.0; remaining slots are filled with
+        typo-tolerant trigram matches.
+        """
+        norm = _normalize(query or "")
+        if not norm or limit <= 0:
+            return []
+
+        results = [(1.0, pos) for pos in self._prefix_matches(norm, limit)]
+        if len(results) < limit:
+            seen = {pos for _, pos in results}
+            for score, pos in self._fuzzy_matches(norm, limit + len(seen), min_score):
+                if pos not in seen:
+                    results.append((score, pos))
+                if len(results) == limit:
+                    break
+
+        return [
+            {"mal_id": self.titles[pos][0], "title": self.titles[pos][1], "score": round(score, 3)}
+            for score, pos in results
+        ]